@@ -0,0 +1,50 @@
+import timeit
+import numpy as np
+
+from project import DEFAULT_MODEL_TERMS, PolynomialModel, GridBasis
+
+
+COEFFICIENTS = [-17.46, -0.00622, 0.04293, 1.5e-5, -1.4e-5, -5e-9]
+
+GRIDS = [
+    ("21 x 21", np.arange(40, 82, 2), np.arange(1300, 1510, 10)),
+    ("401 x 201", np.arange(40, 80.1, 0.1), np.arange(1300, 1501, 1)),
+    ("2001 x 1001", np.arange(40, 80.02, 0.02), np.arange(1300, 1500.2, 0.2)),
+]
+
+
+def hand_written(pg_values, t_values):
+    a0, a1, a2, a3, a4, a5 = COEFFICIENTS
+    t_squared = t_values * t_values
+    base = a0 + a2*t_values + a4*t_squared
+    slope = a1 + a3*t_values + a5*t_squared
+    return (base + np.multiply.outer(pg_values, slope)).ravel()
+
+
+def generic_cold(model, pg_values, t_values):
+    return model.evaluate(GridBasis(pg_values, t_values))
+
+
+def best_time(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    model = PolynomialModel(DEFAULT_MODEL_TERMS, COEFFICIENTS)
+
+    print(f"{'Сетка':>12} {'Вручную, мс':>14} {'Базис+matmul, мс':>18} {'Кэш степеней, мс':>19}")
+    for name, pg_values, t_values in GRIDS:
+        expected = hand_written(pg_values, t_values)
+        basis = GridBasis(pg_values, t_values)
+        assert np.allclose(model.evaluate(basis), expected, rtol=1e-12, atol=1e-9)
+
+        number = max(1, 200000 // expected.size)
+        t_hand = best_time(lambda: hand_written(pg_values, t_values), number)
+        t_cold = best_time(lambda: generic_cold(model, pg_values, t_values), number)
+        t_warm = best_time(lambda: model.evaluate(basis), number)
+
+        print(f"{name:>12} {t_hand*1e3:>14.4f} {t_cold*1e3:>18.4f} {t_warm*1e3:>19.4f}")
+
+
+if __name__ == "__main__":
+    main()
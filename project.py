@@ -12,6 +12,80 @@ import time
 import json
 
 
+DEFAULT_MODEL_TERMS = ((0, 0), (1, 0), (0, 1), (1, 1), (0, 2), (1, 2))
+
+
+class PolynomialModel:
+    
+    def __init__(self, terms, coefficients):
+        self.terms = tuple((int(pg_power), int(t_power)) for pg_power, t_power in terms)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        
+        if not self.terms:
+            raise ValueError("Модель должна содержать хотя бы один член")
+        if len(self.terms) != len(self.coefficients):
+            raise ValueError("Число коэффициентов не совпадает с числом членов модели")
+        if any(pg_power < 0 or t_power < 0 for pg_power, t_power in self.terms):
+            raise ValueError("Показатели степени не могут быть отрицательными")
+        if len(set(self.terms)) != len(self.terms):
+            raise ValueError("Члены модели не должны повторяться")
+        
+        self.pg_powers = tuple(sorted({pg_power for pg_power, _ in self.terms}))
+        self.t_powers = tuple(sorted({t_power for _, t_power in self.terms}))
+        self.coefficient_matrix = np.zeros((len(self.pg_powers), len(self.t_powers)))
+        for (pg_power, t_power), coefficient in zip(self.terms, self.coefficients):
+            self.coefficient_matrix[self.pg_powers.index(pg_power), 
+                                    self.t_powers.index(t_power)] = coefficient
+    
+    @staticmethod
+    def term_label(pg_power, t_power):
+        parts = []
+        for name, power in (("Pg", pg_power), ("T", t_power)):
+            if power == 1:
+                parts.append(name)
+            elif power > 1:
+                parts.append(f"{name}^{power}")
+        return "·".join(parts) if parts else "1"
+    
+    def evaluate(self, basis):
+        t_polynomials = self.coefficient_matrix @ basis.t_matrix(self.t_powers)
+        return (basis.pg_matrix(self.pg_powers) @ t_polynomials).ravel()
+    
+    def operations_count(self, basis):
+        n_pg = len(basis.pg_values)
+        n_t = len(basis.t_values)
+        m = len(self.pg_powers)
+        k = len(self.t_powers)
+        power_ops = (max(self.pg_powers[-1] - 1, 0) * n_pg + 
+                     max(self.t_powers[-1] - 1, 0) * n_t)
+        return power_ops + m * n_t * (2*k - 1) + n_pg * n_t * (2*m - 1)
+
+
+class GridBasis:
+    
+    def __init__(self, pg_values, t_values):
+        self.pg_values = np.asarray(pg_values, dtype=float)
+        self.t_values = np.asarray(t_values, dtype=float)
+        self._pg_powers = [np.ones_like(self.pg_values), self.pg_values]
+        self._t_powers = [np.ones_like(self.t_values), self.t_values]
+    
+    def matches(self, pg_values, t_values):
+        return (np.array_equal(self.pg_values, pg_values) and 
+                np.array_equal(self.t_values, t_values))
+    
+    @staticmethod
+    def _power(powers, exponent):
+        while len(powers) <= exponent:
+            powers.append(powers[-1] * powers[1])
+        return powers[exponent]
+    
+    def pg_matrix(self, exponents):
+        return np.stack([self._power(self._pg_powers, e) for e in exponents], axis=1)
+    
+    def t_matrix(self, exponents):
+        return np.stack([self._power(self._t_powers, e) for e in exponents])
+
+
 class DatabaseManager:
     
     def __init__(self, db_name="ceramics.db"):
@@ -56,15 +130,9 @@ class DatabaseManager:
         """)
         
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS model_coefficients (
-                coefficient_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            CREATE TABLE IF NOT EXISTS model_definitions (
+                model_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 material_id INTEGER NOT NULL,
-                a0 REAL NOT NULL,
-                a1 REAL NOT NULL,
-                a2 REAL NOT NULL,
-                a3 REAL NOT NULL,
-                a4 REAL NOT NULL,
-                a5 REAL NOT NULL,
                 valid_from DATE,
                 valid_to DATE,
                 comment TEXT,
@@ -73,6 +141,18 @@ class DatabaseManager:
             )
         """)
         
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS model_terms (
+                model_id INTEGER NOT NULL,
+                term_index INTEGER NOT NULL,
+                pg_power INTEGER NOT NULL CHECK(pg_power >= 0),
+                t_power INTEGER NOT NULL CHECK(t_power >= 0),
+                coefficient REAL NOT NULL,
+                PRIMARY KEY(model_id, term_index),
+                FOREIGN KEY(model_id) REFERENCES model_definitions(model_id)
+            )
+        """)
+        
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS calculation_sessions (
                 session_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -115,6 +195,8 @@ class DatabaseManager:
                     ("admin", admin_hash, "admin")
                 )
             
+            self.migrate_legacy_coefficients()
+            
             cursor.execute("SELECT COUNT(*) as cnt FROM materials")
             if cursor.fetchone()['cnt'] == 0:
                 cursor.execute(
@@ -125,18 +207,51 @@ class DatabaseManager:
                 )
                 material_id = cursor.lastrowid
                 
-                cursor.execute(
-                    """INSERT INTO model_coefficients 
-                       (material_id, a0, a1, a2, a3, a4, a5, valid_from) 
-                       VALUES (?, ?, ?, ?, ?, ?, ?, DATE('now'))""",
-                    (material_id, -17.46, -0.00622, 0.04293, 1.5e-5, -1.4e-5, -5e-9)
-                )
+                self.insert_model(material_id, PolynomialModel(
+                    DEFAULT_MODEL_TERMS, [-17.46, -0.00622, 0.04293, 1.5e-5, -1.4e-5, -5e-9]
+                ))
             
             self.conn.commit()
             
         except sqlite3.Error as e:
             print(f"Ошибка инициализации: {e}")
     
+    def migrate_legacy_coefficients(self):
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= 1:
+            return
+        
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'model_coefficients'"
+        )
+        legacy_exists = cursor.fetchone() is not None
+        cursor.execute("SELECT COUNT(*) as cnt FROM model_definitions")
+        
+        if legacy_exists and cursor.fetchone()['cnt'] == 0:
+            cursor.execute("SELECT * FROM model_coefficients ORDER BY created_date, coefficient_id")
+            legacy_rows = cursor.fetchall()
+            for row in legacy_rows:
+                cursor.execute(
+                    """INSERT INTO model_definitions 
+                       (material_id, valid_from, valid_to, comment, created_date) 
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (row['material_id'], row['valid_from'], row['valid_to'], 
+                     row['comment'], row['created_date'])
+                )
+                model_id = cursor.lastrowid
+                cursor.executemany(
+                    """INSERT INTO model_terms 
+                       (model_id, term_index, pg_power, t_power, coefficient) 
+                       VALUES (?, ?, ?, ?, ?)""",
+                    [(model_id, i, pg_power, t_power, row[f"a{i}"]) 
+                     for i, (pg_power, t_power) in enumerate(DEFAULT_MODEL_TERMS)]
+                )
+            if legacy_rows:
+                print(f"Коэффициенты перенесены в model_terms: {len(legacy_rows)}")
+        
+        cursor.execute("PRAGMA user_version = 1")
+    
     def verify_user(self, login, password):
         cursor = self.conn.cursor()
         password_hash = hashlib.sha256(password.encode()).hexdigest()
@@ -154,7 +269,7 @@ class DatabaseManager:
         cursor.execute("SELECT material_id, material_name FROM materials ORDER BY material_name")
         return cursor.fetchall()
     
-    def add_material(self, material_name, material_type, description, coeffs):
+    def add_material(self, material_name, material_type, description, model):
         cursor = self.conn.cursor()
         try:
             cursor.execute(
@@ -163,41 +278,56 @@ class DatabaseManager:
             )
             material_id = cursor.lastrowid
             
-            cursor.execute(
-                """INSERT INTO model_coefficients 
-                   (material_id, a0, a1, a2, a3, a4, a5, valid_from) 
-                   VALUES (?, ?, ?, ?, ?, ?, ?, DATE('now'))""",
-                (material_id, coeffs['a0'], coeffs['a1'], coeffs['a2'], 
-                 coeffs['a3'], coeffs['a4'], coeffs['a5'])
-            )
+            self.insert_model(material_id, model)
             
             self.conn.commit()
             return material_id
             
         except sqlite3.IntegrityError:
+            self.conn.rollback()
             raise ValueError("Материал с таким названием уже существует")
     
-    def get_coefficients(self, material_id):
+    def insert_model(self, material_id, model):
         cursor = self.conn.cursor()
         cursor.execute(
-            """SELECT a0, a1, a2, a3, a4, a5 FROM model_coefficients 
-               WHERE material_id = ? ORDER BY created_date DESC LIMIT 1""",
+            "INSERT INTO model_definitions (material_id, valid_from) VALUES (?, DATE('now'))",
             (material_id,)
         )
-        result = cursor.fetchone()
-        if result:
-            return dict(result)
-        return None
+        model_id = cursor.lastrowid
+        cursor.executemany(
+            """INSERT INTO model_terms 
+               (model_id, term_index, pg_power, t_power, coefficient) 
+               VALUES (?, ?, ?, ?, ?)""",
+            [(model_id, i, pg_power, t_power, float(coefficient)) 
+             for i, ((pg_power, t_power), coefficient) 
+             in enumerate(zip(model.terms, model.coefficients))]
+        )
+        return model_id
     
-    def update_coefficients(self, material_id, coeffs):
+    def get_model(self, material_id):
         cursor = self.conn.cursor()
         cursor.execute(
-            """INSERT INTO model_coefficients 
-               (material_id, a0, a1, a2, a3, a4, a5, valid_from) 
-               VALUES (?, ?, ?, ?, ?, ?, ?, DATE('now'))""",
-            (material_id, coeffs['a0'], coeffs['a1'], coeffs['a2'], 
-             coeffs['a3'], coeffs['a4'], coeffs['a5'])
+            """SELECT model_id FROM model_definitions 
+               WHERE material_id = ? ORDER BY created_date DESC, model_id DESC LIMIT 1""",
+            (material_id,)
         )
+        result = cursor.fetchone()
+        if result is None:
+            return None
+        
+        cursor.execute(
+            """SELECT pg_power, t_power, coefficient FROM model_terms 
+               WHERE model_id = ? ORDER BY term_index""",
+            (result['model_id'],)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return None
+        return PolynomialModel([(row['pg_power'], row['t_power']) for row in rows], 
+                               [row['coefficient'] for row in rows])
+    
+    def update_model(self, material_id, model):
+        self.insert_model(material_id, model)
         self.conn.commit()
     
     def save_calculation_session(self, user_id, material_id, pg_min, pg_max, pg_step, 
@@ -224,6 +354,88 @@ class DatabaseManager:
         self.conn.commit()
 
 
+class ModelTermsEditor:
+    
+    def __init__(self, parent, text="Члены модели"):
+        self.frame = ttk.LabelFrame(parent, text=text, padding="10")
+        
+        header = ttk.Frame(self.frame)
+        header.pack(fill=tk.X)
+        ttk.Label(header, text="Степень Pg", width=12).pack(side=tk.LEFT)
+        ttk.Label(header, text="Степень T", width=12).pack(side=tk.LEFT)
+        ttk.Label(header, text="Коэффициент", width=20).pack(side=tk.LEFT)
+        ttk.Label(header, text="Член", width=12).pack(side=tk.LEFT)
+        
+        self.rows_frame = ttk.Frame(self.frame)
+        self.rows_frame.pack(fill=tk.X)
+        self.rows = []
+        
+        ttk.Button(self.frame, text="Добавить член", 
+                  command=lambda: self.add_row(*self.next_free_term(), 0.0)).pack(pady=5)
+    
+    def next_free_term(self):
+        used = set()
+        for _, pg_var, t_var, _ in self.rows:
+            try:
+                used.add((pg_var.get(), t_var.get()))
+            except tk.TclError:
+                pass
+        
+        degree = 0
+        while True:
+            for pg_power in range(degree + 1):
+                term = (pg_power, degree - pg_power)
+                if term not in used:
+                    return term
+            degree += 1
+    
+    def add_row(self, pg_power, t_power, coefficient):
+        row_frame = ttk.Frame(self.rows_frame)
+        row_frame.pack(fill=tk.X, pady=2)
+        
+        pg_var = tk.IntVar(value=pg_power)
+        t_var = tk.IntVar(value=t_power)
+        coeff_var = tk.DoubleVar(value=coefficient)
+        
+        ttk.Spinbox(row_frame, from_=0, to=10, textvariable=pg_var, width=10).pack(side=tk.LEFT, padx=2)
+        ttk.Spinbox(row_frame, from_=0, to=10, textvariable=t_var, width=10).pack(side=tk.LEFT, padx=2)
+        ttk.Entry(row_frame, textvariable=coeff_var, width=20).pack(side=tk.LEFT, padx=2)
+        
+        term_label = ttk.Label(row_frame, width=12)
+        term_label.pack(side=tk.LEFT, padx=2)
+        
+        def update_label(*args):
+            try:
+                term_label.config(text=PolynomialModel.term_label(pg_var.get(), t_var.get()))
+            except tk.TclError:
+                term_label.config(text="?")
+        
+        pg_var.trace_add("write", update_label)
+        t_var.trace_add("write", update_label)
+        update_label()
+        
+        row = (row_frame, pg_var, t_var, coeff_var)
+        
+        def remove_row():
+            row_frame.destroy()
+            self.rows.remove(row)
+        
+        ttk.Button(row_frame, text="Удалить", command=remove_row).pack(side=tk.LEFT, padx=2)
+        self.rows.append(row)
+    
+    def set_model(self, model):
+        for row_frame, _, _, _ in self.rows:
+            row_frame.destroy()
+        self.rows = []
+        for (pg_power, t_power), coefficient in zip(model.terms, model.coefficients):
+            self.add_row(pg_power, t_power, float(coefficient))
+    
+    def get_model(self):
+        terms = [(pg_var.get(), t_var.get()) for _, pg_var, t_var, _ in self.rows]
+        coefficients = [coeff_var.get() for _, _, _, coeff_var in self.rows]
+        return PolynomialModel(terms, coefficients)
+
+
 class CeramicsDensityApp:
     
     def __init__(self, root):
@@ -238,6 +450,7 @@ class CeramicsDensityApp:
         self.current_role = None
         self.current_data = None
         self.canvas_widget = None
+        self.grid_basis = None
         
         self.show_login_screen()
     
@@ -335,25 +548,18 @@ class CeramicsDensityApp:
         desc_var = tk.StringVar()
         ttk.Entry(scrollable_frame, textvariable=desc_var, width=40).pack(pady=5)
         
-        coeff_frame = ttk.LabelFrame(scrollable_frame, text="Коэффициенты", padding="5")
-        coeff_frame.pack(pady=10, fill=tk.BOTH)
-        
-        coeff_vars = {}
-        for key in ["a0", "a1", "a2", "a3", "a4", "a5"]:
-            ttk.Label(coeff_frame, text=f"{key}:").pack()
-            var = tk.DoubleVar(value=0.0)
-            ttk.Entry(coeff_frame, textvariable=var, width=20).pack(pady=2)
-            coeff_vars[key] = var
+        terms_editor = ModelTermsEditor(scrollable_frame)
+        terms_editor.frame.pack(pady=10, fill=tk.BOTH)
+        terms_editor.set_model(PolynomialModel(DEFAULT_MODEL_TERMS, [0.0] * len(DEFAULT_MODEL_TERMS)))
         
         def save_material():
             if not name_var.get():
                 messagebox.showerror("Ошибка", "Введите название!")
                 return
             
-            coeffs = {key: coeff_vars[key].get() for key in coeff_vars}
-            
             try:
-                self.db.add_material(name_var.get(), type_var.get(), desc_var.get(), coeffs)
+                model = terms_editor.get_model()
+                self.db.add_material(name_var.get(), type_var.get(), desc_var.get(), model)
                 messagebox.showinfo("Успех", "Материал добавлен!")
                 self.show_admin_menu()
             except Exception as e:
@@ -385,38 +591,35 @@ class CeramicsDensityApp:
                                      values=material_names, state="readonly", width=30)
         material_combo.pack(pady=5)
         
-        coeff_frame = ttk.LabelFrame(frame, text="Коэффициенты", padding="10")
-        coeff_frame.pack(pady=20, fill=tk.BOTH, expand=True)
-        
-        coeff_vars = {}
+        terms_editor = ModelTermsEditor(frame)
+        terms_editor.frame.pack(pady=20, fill=tk.BOTH, expand=True)
         
         def load_coefficients(material_name):
             material_id = material_ids[material_name]
-            coeffs = self.db.get_coefficients(material_id)
-            if coeffs:
-                for key in ["a0", "a1", "a2", "a3", "a4", "a5"]:
-                    coeff_vars[key].set(coeffs[key])
+            model = self.db.get_model(material_id)
+            if model is None:
+                model = PolynomialModel(DEFAULT_MODEL_TERMS, [0.0] * len(DEFAULT_MODEL_TERMS))
+            terms_editor.set_model(model)
         
         def on_material_change(event):
             load_coefficients(material_var.get())
         
         material_combo.bind("<<ComboboxSelected>>", on_material_change)
         
-        for key in ["a0", "a1", "a2", "a3", "a4", "a5"]:
-            ttk.Label(coeff_frame, text=f"{key}:").pack()
-            var = tk.DoubleVar(value=0.0)
-            ttk.Entry(coeff_frame, textvariable=var, width=20).pack(pady=3)
-            coeff_vars[key] = var
-        
         if material_names:
             load_coefficients(material_names[0])
         
         def save_coefficients():
             material_name = material_var.get()
+            if material_name not in material_ids:
+                messagebox.showerror("Ошибка", "Выберите материал!")
+                return
             material_id = material_ids[material_name]
-            coeffs = {key: coeff_vars[key].get() for key in coeff_vars}
-            self.db.update_coefficients(material_id, coeffs)
-            messagebox.showinfo("Успех", "Коэффициенты обновлены!")
+            try:
+                self.db.update_model(material_id, terms_editor.get_model())
+                messagebox.showinfo("Успех", "Коэффициенты обновлены!")
+            except Exception as e:
+                messagebox.showerror("Ошибка", str(e))
         
         ttk.Button(frame, text="Сохранить", command=save_coefficients).pack(pady=10)
         ttk.Button(frame, text="Назад", command=self.show_admin_menu).pack()
@@ -529,32 +732,25 @@ class CeramicsDensityApp:
     def calculate_density(self, material_id, pg_min, pg_max, pg_step, t_min, t_max, t_step, material_name, parent_frame):
         start_time = time.time()
         
-        coeffs_dict = self.db.get_coefficients(material_id)
-        if not coeffs_dict:
+        model = self.db.get_model(material_id)
+        if model is None:
             messagebox.showerror("Ошибка", "Коэффициенты не найдены!")
             return
         
-        a0 = coeffs_dict['a0']
-        a1 = coeffs_dict['a1']
-        a2 = coeffs_dict['a2']
-        a3 = coeffs_dict['a3']
-        a4 = coeffs_dict['a4']
-        a5 = coeffs_dict['a5']
-        
         pg_values = np.arange(pg_min, pg_max + pg_step, pg_step)
         t_values = np.arange(t_min, t_max + t_step, t_step)
         
-        data = []
-        operations = 0
-        ops_per_calc = 13
+        if self.grid_basis is None or not self.grid_basis.matches(pg_values, t_values):
+            self.grid_basis = GridBasis(pg_values, t_values)
         
-        for pg in pg_values:
-            for t in t_values:
-                rho = a0 + a1*pg + a2*t + a3*pg*t + a4*t**2 + a5*pg*t**2
-                data.append({"Pg": pg, "T": t, "rho": rho})
-                operations += ops_per_calc
+        rho = model.evaluate(self.grid_basis)
+        operations = model.operations_count(self.grid_basis)
         
-        df = pd.DataFrame(data)
+        df = pd.DataFrame({
+            "Pg": np.repeat(pg_values, len(t_values)),
+            "T": np.tile(t_values, len(pg_values)),
+            "rho": rho
+        })
         self.current_data = df
         
         self.tree.delete(*self.tree.get_children())
@@ -568,7 +764,7 @@ class CeramicsDensityApp:
         stats_text = f"Время: {calc_time:.6f} с\nПамять: ~{len(df)*0.001:.2f} МБ"
         self.stats_label.config(text=stats_text)
         
-        calc_text = f"Операции: {operations}\nМин ρ: {df['rho'].min():.2f}\nМакс ρ: {df['rho'].max():.2f}\nСредняя ρ: {df['rho'].mean():.2f}"
+        calc_text = f"Членов модели: {len(model.terms)}\nОперации: {operations}\nМин ρ: {df['rho'].min():.2f}\nМакс ρ: {df['rho'].max():.2f}\nСредняя ρ: {df['rho'].mean():.2f}"
         self.calc_label.config(text=calc_text)
         
         self.db.save_calculation_session(self.current_user_id, material_id, pg_min, pg_max, pg_step,
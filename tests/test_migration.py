@@ -0,0 +1,80 @@
+import os
+import sqlite3
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import DEFAULT_MODEL_TERMS, DatabaseManager
+
+
+def create_legacy_db(path, coefficient_rows):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE materials (
+            material_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            material_name TEXT UNIQUE NOT NULL,
+            material_type TEXT,
+            description TEXT,
+            created_date DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE model_coefficients (
+            coefficient_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            material_id INTEGER NOT NULL,
+            a0 REAL NOT NULL,
+            a1 REAL NOT NULL,
+            a2 REAL NOT NULL,
+            a3 REAL NOT NULL,
+            a4 REAL NOT NULL,
+            a5 REAL NOT NULL,
+            valid_from DATE,
+            valid_to DATE,
+            comment TEXT,
+            created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(material_id) REFERENCES materials(material_id)
+        )
+    """)
+    conn.execute(
+        "INSERT INTO materials (material_name, material_type, description) VALUES (?, ?, ?)",
+        ("Карбид вольфрама-никель", "Твёрдый сплав", "WC-Ni")
+    )
+    for coeffs in coefficient_rows:
+        conn.execute(
+            """INSERT INTO model_coefficients
+               (material_id, a0, a1, a2, a3, a4, a5, valid_from)
+               VALUES (1, ?, ?, ?, ?, ?, ?, DATE('now'))""",
+            coeffs
+        )
+    conn.commit()
+    conn.close()
+
+
+def test_legacy_coefficients_are_migrated(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    old = (-17.46, -0.00622, 0.04293, 1.5e-5, -1.4e-5, -5e-9)
+    latest = (-17.0, -0.006, 0.043, 1.6e-5, -1.3e-5, -4e-9)
+    create_legacy_db(db_path, [old, latest])
+
+    db = DatabaseManager(db_path)
+    model = db.get_model(1)
+    assert model.terms == DEFAULT_MODEL_TERMS
+    assert np.array_equal(model.coefficients, latest)
+    db.conn.close()
+
+    db = DatabaseManager(db_path)
+    count = db.conn.execute("SELECT COUNT(*) FROM model_definitions").fetchone()[0]
+    assert count == 2
+    db.conn.close()
+
+
+def test_empty_legacy_table_is_silent(tmp_path, capsys):
+    db_path = str(tmp_path / "empty.db")
+    create_legacy_db(db_path, [])
+
+    db = DatabaseManager(db_path)
+    assert "перенесены" not in capsys.readouterr().out
+    assert db.conn.execute("PRAGMA user_version").fetchone()[0] == 1
+    db.conn.close()